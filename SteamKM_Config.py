@@ -1,16 +1,108 @@
 # SteamKM_Config.py
 from pathlib import Path
-import json
+import atexit
+import copy
+import logging
+import os
+import threading
+
+try:
+    import orjson
+
+    # Public so SteamKM_Updater parses GitHub responses with the same loader
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def _dumps(config):
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def json_loads(data):
+        return json.loads(data)
+
+    def _dumps(config):
+        return json.dumps(config, indent=2).encode()
 
 CONFIG_FILE_PATH = Path("manager_settings.json").resolve()
+CACHE_FILE_PATH = CONFIG_FILE_PATH.with_name("github_cache.json")
+
+# Parsed config keyed by the file's (mtime_ns, size), so repeated loads skip the read and parse
+_cache = {"stat": None, "data": None, "payload": None}
+
+# Saves within SAVE_DELAY seconds of each other are coalesced into a single write
+SAVE_DELAY = 0.25
+_pending = {"config": None, "timer": None}
+_lock = threading.Lock()
+
+def _file_stat():
+    try:
+        st = CONFIG_FILE_PATH.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
 
 def load_config():
-    if CONFIG_FILE_PATH.exists():
-        try:
-            return json.loads(CONFIG_FILE_PATH.read_text())
-        except json.JSONDecodeError:
+    with _lock:
+        if _pending["config"] is not None:
+            return copy.deepcopy(_pending["config"])
+        stat = _file_stat()
+        if stat is None:
             return {}
-    return {}
+        if stat != _cache["stat"]:
+            try:
+                data = json_loads(CONFIG_FILE_PATH.read_bytes())
+            except ValueError: # Both orjson.JSONDecodeError and json.JSONDecodeError subclass ValueError
+                return {}
+            _cache["stat"], _cache["data"] = stat, data
+        return copy.deepcopy(_cache["data"]) # Callers mutate the returned dict before saving it back
 
 def save_config(config):
-    CONFIG_FILE_PATH.write_text(json.dumps(config, indent=4))
\ No newline at end of file
+    with _lock:
+        _pending["config"] = copy.deepcopy(config)
+        if _pending["timer"] is None:
+            _pending["timer"] = threading.Timer(SAVE_DELAY, _flush_in_background)
+            _pending["timer"].daemon = True
+            _pending["timer"].start()
+
+def flush_config():
+    with _lock:
+        if _pending["timer"] is not None:
+            _pending["timer"].cancel()
+            _pending["timer"] = None
+        if _pending["config"] is not None:
+            _write_config(_pending["config"])
+            _pending["config"] = None # Only once it's on disk, so a failed write is retried by the next flush
+
+def _flush_in_background():
+    # Nothing surfaces an exception raised on the timer thread, so log it here
+    try:
+        flush_config()
+    except Exception as e:
+        logging.error(f"Failed to save config: {e}")
+
+def _write_config(config):
+    payload = _dumps(config)
+    if payload == _cache["payload"] and _cache["stat"] == _file_stat():
+        return
+    _write_atomic(CONFIG_FILE_PATH, payload)
+    _cache["stat"], _cache["data"], _cache["payload"] = _file_stat(), config, payload
+
+def _write_atomic(path, payload):
+    # Write to a sibling file and swap it in, so a crash mid-write never leaves a truncated file
+    temp_path = path.with_suffix(".json.tmp")
+    with open(temp_path, "wb") as f:
+        f.write(payload)
+    os.replace(temp_path, path)
+
+# Cached GitHub responses live in their own file so they don't bloat the user's settings
+def load_cache():
+    try:
+        return json_loads(CACHE_FILE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache):
+    _write_atomic(CACHE_FILE_PATH, _dumps(cache))
+
+atexit.register(flush_config)
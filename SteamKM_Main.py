@@ -15,7 +15,7 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QAction, QIcon, QPixmap, QImage
 from PySide6.QtCore import Qt, QPoint, QTimer, QThread, Signal
 from SteamKM_Version import CURRENT_BUILD
-from SteamKM_Updater import UpdateDialog, UpdateManager
+from SteamKM_Updater import UpdateManager
 from SteamKM_Themes import ColorConfigDialog, Theme, DEFAULT_BR, DEFAULT_BS, DEFAULT_CR, DEFAULT_SR, DEFAULT_SW, BUTTON_HEIGHT
 from SteamKM_Icons import UPDATE_ICON, MENU_ICON, CUSTOMIZATION_ICON
 from SteamKM_Config import load_config, save_config
@@ -262,6 +262,7 @@ class SteamKeyManager(QMainWindow):
             self.apply_theme(self.theme)
 
     def open_update_dialog(self):
+        from SteamKM_UpdateDialog import UpdateDialog # Deferred so startup doesn't pay for the dialog module
         dialog = UpdateDialog(self, CURRENT_BUILD)
         dialog.exec()
 
@@ -0,0 +1,333 @@
+# SteamKM_UpdateDialog.py
+from PySide6.QtWidgets import QMessageBox, QDialog, QVBoxLayout, QLabel, QComboBox, QPushButton, QProgressBar, QTextEdit, QApplication, QGroupBox, QHBoxLayout
+from PySide6.QtCore import Qt, QTimer
+from SteamKM_Version import CURRENT_BUILD
+from SteamKM_Updater import GITHUB_TOKEN, DownloadThread, ReleasesFetchThread, parse_version
+import os
+import sys
+import logging
+import subprocess
+from SteamKM_Config import load_config, save_config, flush_config
+
+class UpdateDialog(QDialog):
+    _MB = 1.0 / (1024 * 1024)
+    _FMT_WITH_ETA = "Downloaded: {:.2f} MB / {:.2f} MB\nEstimated Time: {} seconds"
+    _FMT_NO_ETA = "Download Size: {:.2f} MB / {:.2f} MB"
+
+    def __init__(self, parent=None, current_version=CURRENT_BUILD):
+        super().__init__(parent)
+        self.setWindowTitle("Update Manager")
+        self.resize(480, 600)
+        self.current_version = current_version
+        self.latest_version = None
+        self.download_thread = None
+        self.progress_total = None
+        self.releases_thread = ReleasesFetchThread(self)
+        self.releases_thread.data_ready.connect(self.on_releases_fetched)
+        self.releases_thread.error_signal.connect(self.on_releases_error)
+        self.initializing = True
+        self.setup_ui()
+        self.load_saved_branch()
+        self.initializing = False
+        QTimer.singleShot(100, self.fetch_releases) # Delay update fetch so that the UI can fire right up
+
+    def load_saved_branch(self):
+        try:
+            config = load_config()
+            saved_branch = config.get("selected_branch", "Beta")
+            index = self.branch_combo.findText(saved_branch.capitalize())
+            if index >= 0:
+                self.branch_combo.setCurrentIndex(index)
+        except Exception as e:
+            logging.error(f"Failed to load saved branch: {e}")
+
+    def setup_ui(self):
+        main_layout = QVBoxLayout()
+
+        version_group = QGroupBox()
+        version_layout = QHBoxLayout()
+
+        version_label = QLabel(f"Current Version: <b>{self.current_version}</b>")
+        version_layout.addWidget(version_label)
+
+        select_branch_label = QLabel("Select Branch:")
+        version_layout.addWidget(select_branch_label, alignment=Qt.AlignRight)
+
+        self.branch_combo = QComboBox(fixedWidth=65)
+        self.branch_combo.addItems(["Stable", "Beta"])
+        if GITHUB_TOKEN:
+            self.branch_combo.addItem("Alpha")
+        self.branch_combo.currentIndexChanged.connect(self.on_branch_changed)
+        version_layout.addWidget(self.branch_combo)
+
+        version_group.setLayout(version_layout)
+        main_layout.addWidget(version_group)
+
+        check_update_group = QGroupBox()
+        check_update_layout = QVBoxLayout()
+        self.update_label = QLabel("Checking for updates...", alignment=Qt.AlignCenter)
+        check_update_layout.addWidget(self.update_label)
+
+        button_layout = QHBoxLayout()
+        self.check_updates_button = QPushButton("Check", fixedWidth=75)
+        self.check_updates_button.clicked.connect(self.fetch_releases)
+        button_layout.addWidget(self.check_updates_button)
+
+        self.download_button = QPushButton("Download", visible=False)
+        self.download_button.clicked.connect(self.start_download)
+        button_layout.addWidget(self.download_button)
+        
+        self.version_combo = QComboBox(fixedWidth=122, visible=False)
+        self.version_combo.currentIndexChanged.connect(self.on_version_selected)
+        button_layout.addWidget(self.version_combo)
+
+        self.cancel_button = QPushButton("Cancel", fixedWidth=75, visible=False)
+        self.cancel_button.clicked.connect(self.cancel_download)
+        button_layout.addWidget(self.cancel_button)
+
+        check_update_layout.addLayout(button_layout)
+
+        self.progress_bar = QProgressBar(visible=False)
+        check_update_layout.addWidget(self.progress_bar)
+
+        check_update_group.setLayout(check_update_layout)
+        main_layout.addWidget(check_update_group)
+
+        changelog_group = QGroupBox()
+        changelog_layout = QVBoxLayout()
+
+        changelog_label = QLabel("Changelog:", alignment=Qt.AlignLeft)
+        changelog_layout.addWidget(changelog_label)
+
+        self.changelog_text = QTextEdit(readOnly=True)
+        self.changelog_text.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        changelog_layout.addWidget(self.changelog_text)
+        changelog_group.setLayout(changelog_layout)
+        main_layout.addWidget(changelog_group)
+
+        created_by_label = QLabel("SteamKM by Stick-bon", alignment=Qt.AlignRight)
+        main_layout.addWidget(created_by_label)
+
+        self.setLayout(main_layout)
+
+    def on_branch_changed(self):
+        branch = self.branch_combo.currentText().lower()
+
+        if not self.initializing:
+            self.update_label.setText("Loading...")
+            
+            try:
+                config = load_config()
+                config["selected_branch"] = branch
+                save_config(config)
+            except Exception as e:
+                logging.error(f"Failed to save config: {e}")
+
+            QTimer.singleShot(100, self.fetch_releases)
+
+    def fetch_releases(self):
+        if not self.releases_thread.isRunning():
+            self.releases_thread.start()
+
+    def on_releases_error(self, error_message):
+        self.update_label.setText("Failed to check for updates. Please try again later.")
+        logging.error(f"Error checking for updates: {error_message}")
+
+    def on_releases_fetched(self, versions, changelog_text):
+        branch = self.branch_combo.currentText().lower()
+        try:
+            # Filter versions based on the selected branch
+            if branch == "stable":
+                versions = [v for v in versions if "-stable" in v]
+            elif branch == "beta":
+                versions = [v for v in versions if "-beta" in v]
+            elif branch == "alpha":
+                versions = [v for v in versions if "-alpha" in v]
+            
+            latest_version = versions[0] if versions else None
+
+            self.version_combo.clear()
+            local_version = parse_version(self.current_version)
+            if versions:
+                for version in versions:
+                    item_text = version
+                    if version == latest_version and parse_version(version) > local_version:
+                        item_text = f"{version} (latest)"
+                    self.version_combo.addItem(item_text)
+                self.download_button.setVisible(True)
+            else:
+                self.version_combo.addItem("No Available Updates")
+                self.version_combo.setFixedWidth(140)
+                self.download_button.setVisible(False)
+            
+            self.version_combo.setVisible(True)
+            self.show_changelog(changelog_text)
+
+            if latest_version and local_version >= parse_version(latest_version):
+                self.update_label.setText("You're already on the latest build.")
+                self.version_combo.setFixedWidth(85)
+                return
+            self.update_label.setText("Select a version to download.")
+        except Exception as e:
+            self.on_releases_error(str(e))
+
+    def show_changelog(self, changelog_text):
+        if not changelog_text:
+            self.changelog_text.setPlainText("Failed to fetch changelog.")
+            return
+        lines = changelog_text.split('\n')
+        # Initialize an empty list to hold the HTML lines
+        html_lines = []
+        
+        for line in lines:
+            if line.startswith("0."):
+                # Version header
+                html_lines.append(f"<h3>{line}</h3>")
+            elif line.startswith("+"):
+                # Added items
+                html_lines.append(f"<p><span style='color: green;'><strong>+</strong></span> {line[2:]}</p>")
+            elif line.startswith("*"):
+                # Tweaked items
+                html_lines.append(f"<p><span style='color: orange;'><strong>*</strong></span> {line[2:]}</p>")
+            elif line.startswith("-"):
+                # Removed items
+                html_lines.append(f"<p><span style='color: red;'><strong>-</strong></span> {line[2:]}</p>")
+            else:
+                # Other lines (e.g., empty lines)
+                html_lines.append(f"<p>{line}</p>")
+        
+        # Join the HTML lines into a single string
+        html_changelog = "\n".join(html_lines)
+        self.changelog_text.setHtml(html_changelog)
+
+    def on_version_selected(self, index):
+        selected_version = self.version_combo.itemText(index).replace("(latest)", "").strip()
+        self.download_button.setEnabled(selected_version != self.current_version and self.download_thread is None)
+
+    def start_download(self):
+        if self.download_thread and self.download_thread.isRunning():
+            QMessageBox.warning(self, "Download in Progress", "A download is already in progress.")
+            return
+        selected_version = self.version_combo.currentText().replace("(latest)", "").strip()
+        if selected_version:
+            self.latest_version = selected_version
+            self.update_label.setText("Starting Download...")
+            self.check_updates_button.setVisible(False)
+            self.version_combo.setVisible(False)
+            self.download_button.setVisible(False)
+            self.cancel_button.setVisible(True)
+            self.progress_bar.setVisible(True)
+            self.progress_bar.setRange(0, 0)
+            self.progress_total = None
+
+            self.download_thread = DownloadThread(self.latest_version, self) # Parented so it outlives our reference if cancelled mid-read
+            self.download_thread.progress_signal.connect(self.update_progress)
+            self.download_thread.finished_signal.connect(self.download_finished)
+            self.download_thread.error_signal.connect(self.download_error)
+            self.download_thread.finished.connect(self.download_thread.deleteLater) # Only delete once run() has actually returned
+            self.download_thread.finished.connect(self.on_download_thread_finished)
+            self.download_thread.start()
+        else:
+            QMessageBox.warning(self, "Update Error", "No version selected for download.")
+
+    def cancel_download(self):
+        if self.download_thread and self.download_thread.isRunning():
+            # The thread can still be blocked in a read, so keep Download disabled until it has actually stopped
+            self.update_label.setText("Cancelling download...")
+            self.download_thread.cancel()
+            self.check_updates_button.setVisible(True)
+            self.version_combo.setVisible(True)
+            self.progress_bar.setVisible(False)
+            self.cancel_button.setVisible(False)
+            self.download_button.setEnabled(False)
+            self.download_button.setVisible(True)
+        else:
+            QMessageBox.warning(self, "Download Not Running", "No download is currently running.")
+    
+    def download_error(self, error_message):
+        self.check_updates_button.setVisible(True)
+        self.version_combo.setVisible(True)
+        self.progress_bar.setVisible(False)
+        self.cancel_button.setVisible(False)
+        self.download_button.setVisible(True)
+        self.update_label.setText("Download Error")
+        QMessageBox.critical(self, "Download Error", error_message)
+
+    def update_progress(self, downloaded, total, estimated_time):
+        if total != self.progress_total: # The total only changes once per download, so skip redundant setRange calls
+            self.progress_bar.setRange(0, total)
+            self.progress_total = total
+        self.progress_bar.setValue(downloaded)
+        if estimated_time > 0:
+            self.update_label.setText(self._FMT_WITH_ETA.format(downloaded * self._MB, total * self._MB, int(estimated_time)))
+        else:
+            self.update_label.setText(self._FMT_NO_ETA.format(downloaded * self._MB, total * self._MB))
+
+    def download_finished(self, success):
+        if success:
+            self.progress_bar.setVisible(False)
+            self.cancel_button.setVisible(False)
+            self.download_button.setVisible(True)
+            
+            try:
+                config = load_config()
+                config["show_update_message"] = True
+                save_config(config)
+                flush_config() # The restarted process reads this flag, so it has to hit the disk first
+            except Exception as e:
+                logging.error(f"Failed to update config file: {e}")
+
+            # Create a temporary script to handle the restart
+            restart_script = """
+    import os
+    import sys
+    import time
+
+    # Paths
+    new_executable = '{}'
+    old_executable = '{}'
+    backup_executable = '{}'
+
+    # Wait for the main application to close
+    time.sleep(2)
+
+    # Replace the old executable with the new one
+    os.remove(old_executable)
+    os.rename(new_executable, old_executable)
+
+    # Remove the backup file if it exists
+    if os.path.exists(backup_executable):
+        os.remove(backup_executable)
+
+    # Restart the application
+    os.execv(old_executable, ['python'] + sys.argv)
+    """.format(os.path.realpath(sys.executable) + ".new", os.path.realpath(sys.executable), os.path.realpath(sys.executable) + ".bak")
+
+            # Write the restart script to a temporary file
+            with open("restart_script.py", "w") as f:
+                f.write(restart_script)
+
+            try:
+                # Run the restart script in a new process
+                subprocess.Popen([sys.executable, "restart_script.py"])
+                QApplication.quit()
+            except Exception as e:
+                QMessageBox.information(self, "Restart Required", "Please reopen the program to get the latest update.")
+        else:
+            msg_box = QMessageBox.warning
+            msg_box(self, "Download Failed", f"Update {self.latest_version} failed to download.")
+
+    def on_download_thread_finished(self):
+        cancelled = self.download_thread.is_cancelled() and not self.download_thread.succeeded
+        self.download_thread = None
+        if cancelled:
+            self.update_label.setText("Download cancelled.")
+            self.on_version_selected(self.version_combo.currentIndex())
+
+    def done(self, result):
+        # Write any debounced branch change before the dialog goes away
+        try:
+            flush_config()
+        except Exception as e:
+            logging.error(f"Failed to save config: {e}")
+        super().done(result)
\ No newline at end of file
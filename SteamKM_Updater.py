@@ -1,15 +1,23 @@
 # SteamKM_Updater.py
-from PySide6.QtWidgets import QMessageBox, QDialog, QVBoxLayout, QLabel, QComboBox, QPushButton, QProgressBar, QTextEdit, QApplication, QGroupBox, QHBoxLayout
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
+# Widgets are imported where they're used, the dialog lives in SteamKM_UpdateDialog and is loaded on first open
+from PySide6.QtCore import QThread, Signal, QTimer
 from SteamKM_Version import CURRENT_BUILD
 from packaging.version import parse, InvalidVersion
+from functools import lru_cache
 from time import time
+import hashlib
+import threading
+from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 import os
 import sys
 import logging
-import subprocess
-from SteamKM_Config import load_config, save_config
+from SteamKM_Config import load_cache, save_cache, json_loads
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -20,26 +28,279 @@ except ImportError:
     GITHUB_TOKEN = None
     logging.debug("GitHub token not found. Using unauthenticated requests.")
 
+# Version strings repeat across checks and dialog opens, so only run the regex-backed parser once per string
+parse_version = lru_cache(maxsize=32)(parse)
+_CURRENT_VERSION = parse_version(CURRENT_BUILD)
+
+_LATEST_URL = "https://api.github.com/repos/AbelSniffel/SteamKM/releases/latest"
+_RELEASES_URL = "https://api.github.com/repos/AbelSniffel/SteamKM/releases"
+_TAG_URL = "https://api.github.com/repos/AbelSniffel/SteamKM/releases/tags/{}"
+_CHANGELOG_URL = "https://raw.githubusercontent.com/AbelSniffel/SteamKM/Beta/CHANGELOG.md"
+_GRAPHQL_URL = "https://api.github.com/graphql"
+_RELEASES_QUERY = '{ repository(owner: "AbelSniffel", name: "SteamKM") { releases(first: 30, orderBy: {field: CREATED_AT, direction: DESC}) { nodes { tagName } } } }'
+
+# One shared session so the GitHub calls reuse keep-alive connections instead of a new TLS handshake each
+REQUEST_TIMEOUT = (5, 30)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])))
+_SESSION.headers.update({"Accept": "application/vnd.github+json", "Accept-Encoding": "gzip"})
+if GITHUB_TOKEN:
+    _SESSION.headers["Authorization"] = f"token {GITHUB_TOKEN}"
+
+# Parsed GitHub responses under a key each caller picks (a new key whenever the decoded shape changes), revalidated with their ETag so unchanged data costs a 304 and no parse
+CACHE_MAX_AGE = 60
+_response_cache = load_cache()
+_response_cache_lock = threading.Lock()
+
+def _get_cache_entry(cache_key):
+    with _response_cache_lock:
+        return _response_cache.get(cache_key)
+
+def _is_fresh(entry):
+    return entry is not None and time() - entry["fetched_at"] < CACHE_MAX_AGE
+
+def _store_cache_entry(cache_key, entry):
+    with _response_cache_lock:
+        _response_cache[cache_key] = entry
+        try:
+            save_cache(_response_cache)
+        except OSError as e:
+            logging.error(f"Failed to save response cache: {e}")
+
+def get_cached(url, cache_key, decode=json_loads):
+    entry = _get_cache_entry(cache_key)
+    if _is_fresh(entry):
+        return entry["data"]
+    headers = {"If-None-Match": entry["etag"]} if entry and entry.get("etag") else {}
+    response = _SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    if response.status_code == 304:
+        entry = dict(entry, fetched_at=time())
+    else:
+        response.raise_for_status()
+        entry = {"etag": response.headers.get("ETag"), "data": decode(response.content), "fetched_at": time()}
+    _store_cache_entry(cache_key, entry)
+    return entry["data"]
+
+# The update check only needs tag_name, which precedes the nested asset objects, so skip decoding the whole release
+_TAG_RE = re.compile(rb'"tag_name"\s*:\s*"([^"]+)"')
+
+def decode_tag_name(content):
+    match = _TAG_RE.search(content)
+    return match.group(1).decode() if match else "0.0.0"
+
 def check_for_updates(branch="Beta"):
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else {}
     try:
-        response = requests.get(f"https://api.github.com/repos/AbelSniffel/SteamKM/releases/latest", headers=headers)
-        response.raise_for_status()
-        latest_version = response.json().get("tag_name", "0.0.0")
+        latest_version = get_cached(_LATEST_URL, "latest_tag", decode=decode_tag_name)
         logging.debug(f"Latest version from GitHub: {latest_version}")
-        return latest_version if parse(latest_version) > parse(CURRENT_BUILD) else CURRENT_BUILD
+        return latest_version if parse_version(latest_version) > _CURRENT_VERSION else CURRENT_BUILD
     except Exception as e:
         logging.error(f"Error checking for updates: {e}")
+        from PySide6.QtWidgets import QMessageBox
         QMessageBox.critical(None, "Update Error", str(e))
         return CURRENT_BUILD
 
-def download_update(latest_version, progress_callback):
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else {}
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 512 * 1024
+FAST_DOWNLOAD_SPEED = 5 * 1024 * 1024
+WRITE_QUEUE_SIZE = 16
+RANGE_WORKERS = 4
+RANGE_CHUNK_SIZE = 256 * 1024
+RANGE_RETRIES = 3
+PARALLEL_MIN_SIZE = 4 * 1024 * 1024
+_CONTENT_RANGE_RE = re.compile(r"bytes (\d+)-")
+
+def decode_release_tags(content):
+    return [release["tag_name"] for release in json_loads(content)]
+
+def fetch_release_tags():
+    # GraphQL returns only the tag names instead of every release body and asset, but GitHub requires a token for it
+    if GITHUB_TOKEN:
+        # GraphQL has no ETags, so the result is only reused for CACHE_MAX_AGE seconds
+        cache_key = "graphql_release_tags"
+        entry = _get_cache_entry(cache_key)
+        if _is_fresh(entry):
+            return entry["data"]
+        try:
+            response = _SESSION.post(_GRAPHQL_URL, json={"query": _RELEASES_QUERY}, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            nodes = json_loads(response.content)["data"]["repository"]["releases"]["nodes"]
+            tags = [node["tagName"] for node in nodes]
+            _store_cache_entry(cache_key, {"etag": None, "data": tags, "fetched_at": time()})
+            return tags
+        except Exception as e:
+            logging.error(f"GraphQL release query failed, falling back to REST: {e}")
+    return get_cached(_RELEASES_URL, "release_tags", decode=decode_release_tags)
+
+def decode_text(content):
+    return content.decode("utf-8")
+
+def fetch_changelog_text():
+    return get_cached(_CHANGELOG_URL, "changelog", decode=decode_text)
+
+def _preallocate(f, size):
+    # Reserve the whole file up front so the filesystem lays it out once instead of growing it per chunk
     try:
-        release_url = f"https://api.github.com/repos/AbelSniffel/SteamKM/releases/tags/{latest_version}"
-        response = requests.get(release_url, headers=headers)
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(f.fileno(), 0, size)
+        else:
+            f.truncate(size)
+            f.seek(0)
+    except OSError as e:
+        logging.debug(f"Failed to preallocate update file: {e}")
+
+def _write_chunks(write_queue, f, hasher, write_errors):
+    # Keep draining after a failure so the download loop never blocks on a full queue
+    while (chunk := write_queue.get()) is not None:
+        if not write_errors:
+            try:
+                f.write(chunk)
+                hasher.update(chunk)
+            except OSError as e:
+                write_errors.append(e)
+
+def _expected_sha256(asset):
+    # Newer GitHub API versions expose asset digests as "sha256:<hex>"
+    digest = asset.get("digest") or ""
+    return digest[len("sha256:"):] if digest.startswith("sha256:") else None
+
+def _file_sha256(path):
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(MAX_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def _download_asset(download_url, update_path, file_size, progress_callback, cancel_event):
+    hasher = hashlib.sha256()
+    with open(update_path, 'wb') as f:
+        _preallocate(f, file_size)
+        # Disk writes happen on their own thread so a slow disk or antivirus scan doesn't stall the socket reads
+        write_queue = Queue(maxsize=WRITE_QUEUE_SIZE)
+        write_errors = []
+        writer = threading.Thread(target=_write_chunks, args=(write_queue, f, hasher, write_errors), daemon=True)
+        writer.start()
+        try:
+            with _SESSION.get(download_url, stream=True, timeout=REQUEST_TIMEOUT) as r:
+                r.raise_for_status()
+                r.raw.decode_content = True # No-op for the plain exe, but keeps a compressed response correct
+                chunk_size = MIN_CHUNK_SIZE
+                downloaded = 0
+                last_check, last_downloaded = time(), 0
+                while not write_errors and (chunk := r.raw.read(chunk_size)):
+                    if cancel_event.is_set():
+                        break
+                    write_queue.put(chunk)
+                    downloaded += len(chunk)
+                    progress_callback(downloaded, file_size)
+                    # Grow the chunk size on fast links so each MB costs fewer Python-level reads and callbacks
+                    now = time()
+                    if now - last_check >= 1:
+                        if chunk_size < MAX_CHUNK_SIZE and (downloaded - last_downloaded) / (now - last_check) > FAST_DOWNLOAD_SPEED:
+                            chunk_size *= 2
+                        last_check, last_downloaded = now, downloaded
+        finally:
+            write_queue.put(None)
+            writer.join()
+            f.truncate() # Drop any preallocated tail the download didn't fill
+        if write_errors:
+            raise write_errors[0]
+    return hasher.hexdigest()
+
+def _remove_partial(update_path):
+    if os.path.exists(update_path):
+        os.remove(update_path)
+
+def _download_range(download_url, f, start, end, file_lock, on_progress, stop_event):
+    # A dropped connection resumes from the last byte written instead of restarting the range
+    offset = start
+    failures = 0
+    while offset <= end and not stop_event.is_set():
+        try:
+            # Byte ranges of a compressed body wouldn't line up with file offsets, so ask for the file as-is
+            with _SESSION.get(download_url, headers={"Range": f"bytes={offset}-{end}", "Accept-Encoding": "identity"}, stream=True, timeout=REQUEST_TIMEOUT) as r:
+                r.raise_for_status()
+                if r.status_code != 206:
+                    return False # Server ignored the range and is sending the whole file
+                match = _CONTENT_RANGE_RE.match(r.headers.get("Content-Range", ""))
+                if not match or int(match.group(1)) != offset:
+                    return False # Bytes starting anywhere else would land at the wrong file offset
+                r.raw.decode_content = True
+                while offset <= end and not stop_event.is_set() and (chunk := r.raw.read(RANGE_CHUNK_SIZE)):
+                    with file_lock:
+                        f.seek(offset)
+                        f.write(chunk)
+                    offset += len(chunk)
+                    on_progress(len(chunk))
+        except (requests.RequestException, Urllib3HTTPError) as e:
+            logging.debug(f"Range {start}-{end} interrupted at byte {offset}: {e}")
+        if offset <= end and not stop_event.is_set():
+            failures += 1
+            if failures > RANGE_RETRIES:
+                raise Exception(f"Download of range {start}-{end} kept failing at byte {offset}.")
+    return True
+
+def _download_asset_ranged(download_url, update_path, file_size, progress_callback, cancel_event, expected_digest):
+    # Several concurrent range requests usually beat a single stream from the release CDN
+    # Returns None when cancelled, when the server doesn't honour ranges or when a range can't be recovered,
+    # so the caller can fall back to a single stream
+    part_size = -(-file_size // RANGE_WORKERS)
+    ranges = [(start, min(start + part_size, file_size) - 1) for start in range(0, file_size, part_size)]
+    file_lock = threading.Lock()
+    progress_lock = threading.Lock()
+    stop_event = threading.Event()
+    downloaded = 0
+
+    def on_progress(size):
+        nonlocal downloaded
+        with progress_lock:
+            downloaded += size
+            progress_callback(downloaded, file_size)
+        if cancel_event.is_set():
+            stop_event.set()
+
+    def run_range(start, end):
+        try:
+            supported = _download_range(download_url, f, start, end, file_lock, on_progress, stop_event)
+        except Exception as e:
+            logging.error(f"Ranged download failed, falling back to a single stream: {e}")
+            supported = False
+        if not supported:
+            stop_event.set()
+        return supported
+
+    with open(update_path, 'wb') as f:
+        _preallocate(f, file_size)
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(run_range, start, end) for start, end in ranges]
+            results = [future.result() for future in futures]
+    if cancel_event.is_set() or not all(results):
+        _remove_partial(update_path)
+        return None
+    # Ranges arrive out of order, so hashing means rereading the file, which is only worth it when there's a digest to check
+    return _file_sha256(update_path) if expected_digest else ""
+
+def _install_update(update_path, script_path):
+    if sys.platform == "win32":
+        # Windows refuses to overwrite a running image but allows renaming it, so move it aside first
+        backup_path = script_path + ".bak"
+        if os.path.exists(backup_path):
+            os.remove(backup_path)
+        os.replace(script_path, backup_path)
+        try:
+            os.replace(update_path, script_path)
+        except OSError:
+            os.replace(backup_path, script_path) # Put the old build back rather than leave no executable at all
+            raise
+    else:
+        # The running process keeps its old inode, so a single atomic rename is enough
+        os.replace(update_path, script_path)
+
+def download_update(latest_version, progress_callback, cancel_event=None):
+    cancel_event = cancel_event or threading.Event()
+    try:
+        response = _SESSION.get(_TAG_URL.format(latest_version), timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
-        assets = response.json().get("assets", [])
+        assets = json_loads(response.content).get("assets", [])
         for asset in assets:
             if asset.get("name") == "SteamKM.exe":
                 download_url = asset.get("browser_download_url")
@@ -48,19 +309,30 @@ def download_update(latest_version, progress_callback):
                 file_size = asset.get("size", 0)
                 if not file_size:
                     raise Exception("Failed to get file size.")
-                progress_callback(0, file_size)
-                with open(update_path, 'wb') as f:
-                    with requests.get(download_url, headers=headers, stream=True) as r:
-                        r.raise_for_status()
-                        for chunk in r.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                                progress_callback(r.raw.tell(), file_size)
-                backup_path = script_path + ".bak"
-                if os.path.exists(backup_path):
-                    os.remove(backup_path)
-                os.rename(script_path, backup_path)
-                os.rename(update_path, script_path)
+                expected_digest = _expected_sha256(asset)
+                # A finished download from an earlier attempt can be installed without touching the network
+                if expected_digest and os.path.exists(update_path) and os.path.getsize(update_path) == file_size and _file_sha256(update_path) == expected_digest:
+                    logging.debug(f"Reusing verified download at {update_path}")
+                    progress_callback(file_size, file_size)
+                else:
+                    progress_callback(0, file_size)
+                    try:
+                        digest = None
+                        if file_size >= PARALLEL_MIN_SIZE:
+                            digest = _download_asset_ranged(download_url, update_path, file_size, progress_callback, cancel_event, expected_digest)
+                        if digest is None and not cancel_event.is_set():
+                            progress_callback(0, file_size)
+                            digest = _download_asset(download_url, update_path, file_size, progress_callback, cancel_event)
+                    except Exception:
+                        _remove_partial(update_path) # Never leave a half-written, preallocated file behind
+                        raise
+                    if cancel_event.is_set():
+                        _remove_partial(update_path)
+                        return False
+                    if expected_digest and digest != expected_digest:
+                        _remove_partial(update_path)
+                        raise Exception(f"Checksum mismatch for version {latest_version}, the download may be corrupted.")
+                _install_update(update_path, script_path)
                 return True
         raise Exception("No matching asset found for version {latest_version}")
     except Exception as e:
@@ -82,6 +354,7 @@ class UpdateManager:
 
     def on_update_available(self, available):
         if available:
+            from PySide6.QtWidgets import QLabel
             update_available_label = self.parent.findChild(QLabel, "update_available_label")
             if update_available_label:
                 update_available_label.setVisible(True)
@@ -102,327 +375,70 @@ class UpdateCheckThread(QThread):
     update_available = Signal(bool)
 
     def run(self):
-        available = parse(check_for_updates()) > parse(CURRENT_BUILD)
+        available = parse_version(check_for_updates()) > _CURRENT_VERSION
         self.update_available.emit(available)
 
+class ReleasesFetchThread(QThread):
+    data_ready = Signal(list, str)
+    error_signal = Signal(str)
+
+    def run(self):
+        # The release list and the changelog are independent, so overlap the two round trips
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            releases_future = executor.submit(fetch_release_tags)
+            changelog_future = executor.submit(fetch_changelog_text)
+            try:
+                versions = releases_future.result()
+            except Exception as e:
+                self.error_signal.emit(str(e))
+                return
+            try:
+                changelog_text = changelog_future.result()
+            except Exception as e:
+                logging.error(f"Failed to fetch changelog: {e}")
+                changelog_text = ""
+        self.data_ready.emit(versions, changelog_text)
+
 class DownloadThread(QThread):
     progress_signal = Signal(int, int, float)
     finished_signal = Signal(bool)
     error_signal = Signal(str)
 
+    PROGRESS_INTERVAL = 0.05 # Seconds between progress emits, ~20 Hz is as fast as the UI can usefully redraw
+
     def __init__(self, latest_version, parent=None):
         super().__init__(parent)
         self.latest_version = latest_version
         self.start_time = None
+        self._last_emit = 0.0
+        self._cancel = threading.Event()
+        self.succeeded = False
+
+    def cancel(self):
+        self._cancel.set()
+
+    def is_cancelled(self):
+        return self._cancel.is_set()
 
     def run(self):
         try:
             self.start_time = time()
-            success = download_update(self.latest_version, self.update_progress)
-            self.finished_signal.emit(success)
+            success = download_update(self.latest_version, self.update_progress, self._cancel)
+            self.succeeded = success
+            # A cancel that lands after the update is installed is too late, so only failures of a cancelled run are dropped
+            if success or not self._cancel.is_set():
+                self.finished_signal.emit(success)
         except Exception as e:
-            self.error_signal.emit(str(e))
+            if not self._cancel.is_set():
+                self.error_signal.emit(str(e))
 
     def update_progress(self, downloaded, total):
-        elapsed_time = time() - self.start_time if self.start_time else 0
+        now = time()
+        if downloaded < total and now - self._last_emit < self.PROGRESS_INTERVAL:
+            return
+        self._last_emit = now
+        elapsed_time = now - self.start_time if self.start_time else 0
         download_speed = downloaded / elapsed_time if elapsed_time > 0 and downloaded > 0 else 0
         remaining_bytes = total - downloaded
         estimated_time = remaining_bytes / download_speed if download_speed > 0 else 0
         self.progress_signal.emit(downloaded, total, estimated_time)
-
-class UpdateDialog(QDialog):
-    def __init__(self, parent=None, current_version=CURRENT_BUILD):
-        super().__init__(parent)
-        self.setWindowTitle("Update Manager")
-        self.resize(480, 600)
-        self.current_version = current_version
-        self.latest_version = None
-        self.download_thread = None
-        self.initializing = True
-        self.setup_ui()
-        self.load_saved_branch()
-        self.initializing = False
-        QTimer.singleShot(100, self.fetch_releases) # Delay update fetch so that the UI can fire right up
-
-    def load_saved_branch(self):
-        try:
-            config = load_config()
-            saved_branch = config.get("selected_branch", "Beta")
-            index = self.branch_combo.findText(saved_branch.capitalize())
-            if index >= 0:
-                self.branch_combo.setCurrentIndex(index)
-        except Exception as e:
-            logging.error(f"Failed to load saved branch: {e}")
-
-    def setup_ui(self):
-        main_layout = QVBoxLayout()
-
-        version_group = QGroupBox()
-        version_layout = QHBoxLayout()
-
-        version_label = QLabel(f"Current Version: <b>{self.current_version}</b>")
-        version_layout.addWidget(version_label)
-
-        select_branch_label = QLabel("Select Branch:")
-        version_layout.addWidget(select_branch_label, alignment=Qt.AlignRight)
-
-        self.branch_combo = QComboBox(fixedWidth=65)
-        self.branch_combo.addItems(["Stable", "Beta"])
-        if GITHUB_TOKEN:
-            self.branch_combo.addItem("Alpha")
-        self.branch_combo.currentIndexChanged.connect(self.on_branch_changed)
-        version_layout.addWidget(self.branch_combo)
-
-        version_group.setLayout(version_layout)
-        main_layout.addWidget(version_group)
-
-        check_update_group = QGroupBox()
-        check_update_layout = QVBoxLayout()
-        self.update_label = QLabel("Checking for updates...", alignment=Qt.AlignCenter)
-        check_update_layout.addWidget(self.update_label)
-
-        button_layout = QHBoxLayout()
-        self.check_updates_button = QPushButton("Check", fixedWidth=75)
-        self.check_updates_button.clicked.connect(self.fetch_releases)
-        button_layout.addWidget(self.check_updates_button)
-
-        self.download_button = QPushButton("Download", visible=False)
-        self.download_button.clicked.connect(self.start_download)
-        button_layout.addWidget(self.download_button)
-        
-        self.version_combo = QComboBox(fixedWidth=122, visible=False)
-        self.version_combo.currentIndexChanged.connect(self.on_version_selected)
-        button_layout.addWidget(self.version_combo)
-
-        self.cancel_button = QPushButton("Cancel", fixedWidth=75, visible=False)
-        self.cancel_button.clicked.connect(self.cancel_download)
-        button_layout.addWidget(self.cancel_button)
-
-        check_update_layout.addLayout(button_layout)
-
-        self.progress_bar = QProgressBar(visible=False)
-        check_update_layout.addWidget(self.progress_bar)
-
-        check_update_group.setLayout(check_update_layout)
-        main_layout.addWidget(check_update_group)
-
-        changelog_group = QGroupBox()
-        changelog_layout = QVBoxLayout()
-
-        changelog_label = QLabel("Changelog:", alignment=Qt.AlignLeft)
-        changelog_layout.addWidget(changelog_label)
-
-        self.changelog_text = QTextEdit(readOnly=True)
-        self.changelog_text.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        changelog_layout.addWidget(self.changelog_text)
-        changelog_group.setLayout(changelog_layout)
-        main_layout.addWidget(changelog_group)
-
-        created_by_label = QLabel("SteamKM by Stick-bon", alignment=Qt.AlignRight)
-        main_layout.addWidget(created_by_label)
-
-        self.setLayout(main_layout)
-
-    def on_branch_changed(self):
-        branch = self.branch_combo.currentText().lower()
-
-        if not self.initializing:
-            self.update_label.setText("Loading...")
-            
-            try:
-                config = load_config()
-                config["selected_branch"] = branch
-                save_config(config)
-            except Exception as e:
-                logging.error(f"Failed to save config: {e}")
-
-            QTimer.singleShot(100, self.fetch_releases)
-
-    def fetch_releases(self):
-        branch = self.branch_combo.currentText().lower()
-        headers = {"Authorization": f"token {GITHUB_TOKEN}"} if GITHUB_TOKEN else {}
-        try:
-            response = requests.get(f"https://api.github.com/repos/AbelSniffel/SteamKM/releases", headers=headers)
-            response.raise_for_status()
-            releases = response.json()
-            versions = [release["tag_name"] for release in releases]
-            
-            # Filter versions based on the selected branch
-            if branch == "stable":
-                versions = [v for v in versions if "-stable" in v]
-            elif branch == "beta":
-                versions = [v for v in versions if "-beta" in v]
-            elif branch == "alpha":
-                versions = [v for v in versions if "-alpha" in v]
-            
-            latest_version = versions[0] if versions else None
-
-            self.version_combo.clear()
-            local_version = parse(self.current_version)
-            if versions:
-                for version in versions:
-                    item_text = version
-                    if version == latest_version and parse(version) > local_version:
-                        item_text = f"{version} (latest)"
-                    self.version_combo.addItem(item_text)
-                self.download_button.setVisible(True)
-            else:
-                self.version_combo.addItem("No Available Updates")
-                self.version_combo.setFixedWidth(140)
-                self.download_button.setVisible(False)
-            
-            self.version_combo.setVisible(True)
-            self.fetch_changelog()
-
-            if latest_version and local_version >= parse(latest_version):
-                self.update_label.setText("You're already on the latest build.")
-                self.version_combo.setFixedWidth(85)
-                return
-            self.update_label.setText("Select a version to download.")
-        except Exception as e:
-            self.update_label.setText("Failed to check for updates. Please try again later.")
-            logging.error(f"Error checking for updates: {e}")
-
-    def fetch_changelog(self):
-        try:
-            response = requests.get(f"https://raw.githubusercontent.com/AbelSniffel/SteamKM/Beta/CHANGELOG.md")
-            if response.status_code == 200:
-                changelog_text = response.text
-                lines = changelog_text.split('\n')
-                # Initialize an empty list to hold the HTML lines
-                html_lines = []
-                
-                for line in lines:
-                    if line.startswith("0."):
-                        # Version header
-                        html_lines.append(f"<h3>{line}</h3>")
-                    elif line.startswith("+"):
-                        # Added items
-                        html_lines.append(f"<p><span style='color: green;'><strong>+</strong></span> {line[2:]}</p>")
-                    elif line.startswith("*"):
-                        # Tweaked items
-                        html_lines.append(f"<p><span style='color: orange;'><strong>*</strong></span> {line[2:]}</p>")
-                    elif line.startswith("-"):
-                        # Removed items
-                        html_lines.append(f"<p><span style='color: red;'><strong>-</strong></span> {line[2:]}</p>")
-                    else:
-                        # Other lines (e.g., empty lines)
-                        html_lines.append(f"<p>{line}</p>")
-                
-                # Join the HTML lines into a single string
-                html_changelog = "\n".join(html_lines)
-                self.changelog_text.setHtml(html_changelog)
-            else:
-                self.changelog_text.setPlainText("Failed to fetch changelog.")
-        except Exception as e:
-            self.changelog_text.setPlainText(f"Failed to fetch changelog: {e}")
-
-    def on_version_selected(self, index):
-        selected_version = self.version_combo.itemText(index).replace("(latest)", "").strip()
-        self.download_button.setEnabled(selected_version != self.current_version)
-
-    def start_download(self):
-        if self.download_thread and self.download_thread.isRunning():
-            QMessageBox.warning(self, "Download in Progress", "A download is already in progress.")
-            return
-        selected_version = self.version_combo.currentText().replace("(latest)", "").strip()
-        if selected_version:
-            self.latest_version = selected_version
-            self.update_label.setText("Starting Download...")
-            self.check_updates_button.setVisible(False)
-            self.version_combo.setVisible(False)
-            self.download_button.setVisible(False)
-            self.cancel_button.setVisible(True)
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setRange(0, 0)
-
-            self.download_thread = DownloadThread(self.latest_version)
-            self.download_thread.progress_signal.connect(self.update_progress)
-            self.download_thread.finished_signal.connect(self.download_finished)
-            self.download_thread.error_signal.connect(self.download_error)
-            self.download_thread.start()
-        else:
-            QMessageBox.warning(self, "Update Error", "No version selected for download.")
-
-    def cancel_download(self):
-        if self.download_thread and self.download_thread.isRunning():
-            self.update_label.setText("Download cancelled.")
-            self.download_thread.terminate()
-            self.download_thread.wait()
-            self.download_thread = None
-            self.check_updates_button.setVisible(True)
-            self.version_combo.setVisible(True)
-            self.progress_bar.setVisible(False)
-            self.cancel_button.setVisible(False)
-            self.download_button.setVisible(True)
-        else:
-            QMessageBox.warning(self, "Download Not Running", "No download is currently running.")
-    
-    def download_error(self, error_message):
-        self.check_updates_button.setVisible(True)
-        self.version_combo.setVisible(True)
-        self.progress_bar.setVisible(False)
-        self.cancel_button.setVisible(False)
-        self.download_button.setVisible(True)
-        self.update_label.setText("Download Error")
-        QMessageBox.critical(self, "Download Error", error_message)
-
-    def update_progress(self, downloaded, total, estimated_time):
-        self.progress_bar.setRange(0, total)
-        self.progress_bar.setValue(downloaded)
-        self.update_label.setText(f"Downloaded: {downloaded / (1024 * 1024):.2f} MB / {total / (1024 * 1024):.2f} MB\nEstimated Time: {int(estimated_time)} seconds" if estimated_time > 0 else f"Download Size: {downloaded / (1024 * 1024):.2f} MB / {total / (1024 * 1024):.2f} MB")
-
-    def download_finished(self, success):
-        if success:
-            self.progress_bar.setVisible(False)
-            self.cancel_button.setVisible(False)
-            self.download_button.setVisible(True)
-            
-            try:
-                config = load_config()
-                config["show_update_message"] = True
-                save_config(config)
-            except Exception as e:
-                logging.error(f"Failed to update config file: {e}")
-
-            # Create a temporary script to handle the restart
-            restart_script = """
-    import os
-    import sys
-    import time
-
-    # Paths
-    new_executable = '{}'
-    old_executable = '{}'
-    backup_executable = '{}'
-
-    # Wait for the main application to close
-    time.sleep(2)
-
-    # Replace the old executable with the new one
-    os.remove(old_executable)
-    os.rename(new_executable, old_executable)
-
-    # Remove the backup file if it exists
-    if os.path.exists(backup_executable):
-        os.remove(backup_executable)
-
-    # Restart the application
-    os.execv(old_executable, ['python'] + sys.argv)
-    """.format(os.path.realpath(sys.executable) + ".new", os.path.realpath(sys.executable), os.path.realpath(sys.executable) + ".bak")
-
-            # Write the restart script to a temporary file
-            with open("restart_script.py", "w") as f:
-                f.write(restart_script)
-
-            try:
-                # Run the restart script in a new process
-                subprocess.Popen([sys.executable, "restart_script.py"])
-                QApplication.quit()
-            except Exception as e:
-                QMessageBox.information(self, "Restart Required", "Please reopen the program to get the latest update.")
-        else:
-            msg_box = QMessageBox.warning
-            msg_box(self, "Download Failed", f"Update {self.latest_version} failed to download.")
-            self.download_thread.deleteLater()
-            self.download_thread = None
\ No newline at end of file